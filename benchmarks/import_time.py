@@ -0,0 +1,89 @@
+"""
+Import-time benchmark for the shining_rock_data package.
+
+Each module is imported in a fresh interpreter so nothing is cached between runs. For every
+module the script reports the median wall time and checks that none of the heavy
+dependencies (pandas, Selenium, BeautifulSoup, requests, aiohttp) were pulled in, since
+scheduler workers import the package long before (or without ever) running a stage.
+`import pandas` is timed as well for comparison.
+
+Usage:
+    python benchmarks/import_time.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "shining_rock_data",
+    "shining_rock_data.cli",
+    "shining_rock_data.config",
+    "shining_rock_data.metrics",
+    "shining_rock_data.dsire_etl",
+    "shining_rock_data.places",
+    "shining_rock_data.places_async",
+]
+
+HEAVY_MODULES = ["pandas", "selenium", "bs4", "requests", "aiohttp"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def time_import(module: str, runs: int) -> dict:
+    """Imports `module` in `runs` fresh interpreters; returns the median time and heavy modules loaded."""
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        probe = json.loads(result.stdout)
+        timings.append(probe["seconds"])
+        loaded.update(probe["loaded"])
+    return {"seconds": statistics.median(timings), "loaded": sorted(loaded)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module (default: 5).")
+    parser.add_argument("--skip-pandas", action="store_true", help="Don't time `import pandas` for comparison.")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<34} {'median ms':>10}  heavy deps loaded")
+    for module in MODULES:
+        result = time_import(module, args.runs)
+        print(f"{module:<34} {result['seconds'] * 1000:>10.1f}  {', '.join(result['loaded']) or '-'}")
+        if result["loaded"]:
+            failures.append(module)
+
+    if not args.skip_pandas:
+        try:
+            result = time_import("pandas", args.runs)
+            print(f"{'pandas (for comparison)':<34} {result['seconds'] * 1000:>10.1f}")
+        except subprocess.CalledProcessError:
+            print("pandas is not installed; skipping comparison.")
+
+    if failures:
+        print(f"\nHeavy dependencies imported at import time by: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
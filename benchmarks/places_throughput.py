@@ -0,0 +1,160 @@
+"""
+Throughput benchmark for the Places clients against a local mock server.
+
+Compares:
+  - sync:     shining_rock_data.places.text_search_places called in a loop
+  - threaded: the same function called from a thread pool
+  - async:    shining_rock_data.places_async.AsyncPlacesClient with one shared connection pool
+
+No API key or network access is needed; the mock server answers every request with a
+canned response after a fixed delay to simulate API latency.
+
+Usage:
+    python benchmarks/places_throughput.py --requests 500 --latency-ms 50 --threads 32 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shining_rock_data import places
+from shining_rock_data.metrics import METRICS
+from shining_rock_data.places_async import AsyncPlacesClient
+
+
+class _MockPlacesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients can reuse connections
+    latency_seconds = 0.0
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        time.sleep(self.latency_seconds)
+
+        if parsed.path.endswith("/textsearch/json"):
+            query = params.get('query', [''])[0]
+            payload = {
+                "status": "OK",
+                "results": [{"name": query, "place_id": f"mock-{abs(hash(query))}"}],
+            }
+        elif parsed.path.endswith("/details/json"):
+            place_id = params.get('place_id', [''])[0]
+            payload = {
+                "status": "OK",
+                "result": {"name": "Mock Place", "place_id": place_id, "formatted_address": "1 Main St"},
+            }
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 4096
+
+
+def start_mock_server(latency_seconds: float):
+    handler = type("_Handler", (_MockPlacesHandler,), {"latency_seconds": latency_seconds})
+    server = _MockServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _use_mock_endpoints(base_url):
+    # The sync functions read these module constants on every call.
+    places.BASE_URL_TEXT_SEARCH = f"{base_url}/textsearch/json"
+    places.BASE_URL_PLACE_DETAILS = f"{base_url}/details/json"
+
+
+def bench_sync(queries):
+    return [places.text_search_places(q, "MOCK-KEY") for q in queries]
+
+
+def bench_threaded(queries, threads):
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(lambda q: places.text_search_places(q, "MOCK-KEY"), queries))
+
+
+def bench_async(queries, base_url, concurrency, qps):
+    async def _run():
+        async with AsyncPlacesClient(
+            "MOCK-KEY",
+            max_concurrency=concurrency,
+            qps=qps,
+            text_search_url=f"{base_url}/textsearch/json",
+            place_details_url=f"{base_url}/details/json",
+        ) as client:
+            return await client.text_search_many(queries)
+
+    return asyncio.run(_run())
+
+
+def _report(label, elapsed, results):
+    ok = sum(1 for r in results if r.get("status") == "OK")
+    print(f"{label:<10} {len(results):>7} req  {elapsed:>8.2f} s  {len(results) / elapsed:>10.1f} req/s  ({ok} OK)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="Number of text searches per mode.")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Simulated server latency per request.")
+    parser.add_argument("--threads", type=int, default=32, help="Worker threads for the threaded mode.")
+    parser.add_argument("--concurrency", type=int, default=200, help="max_concurrency for the async client.")
+    parser.add_argument("--qps", type=float, default=None, help="Optional QPS limit for the async client.")
+    parser.add_argument("--skip-sync", action="store_true", help="Skip the (slow) sequential mode.")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Write request counts and latency percentiles to this file (.json or Prometheus text).")
+    args = parser.parse_args()
+
+    if args.metrics_file:
+        METRICS.enable()
+
+    server = start_mock_server(args.latency_ms / 1000.0)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    _use_mock_endpoints(base_url)
+    queries = [f"Coffee shop {i} in Tryon, NC" for i in range(args.requests)]
+
+    print(f"--- Mock server at {base_url}, {args.latency_ms:.0f} ms simulated latency ---")
+    try:
+        if not args.skip_sync:
+            start = time.perf_counter()
+            results = bench_sync(queries)
+            _report("sync", time.perf_counter() - start, results)
+
+        start = time.perf_counter()
+        results = bench_threaded(queries, args.threads)
+        _report("threaded", time.perf_counter() - start, results)
+
+        start = time.perf_counter()
+        results = bench_async(queries, base_url, args.concurrency, args.qps)
+        _report("async", time.perf_counter() - start, results)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.metrics_file:
+        METRICS.write(args.metrics_file)
+        print(f"Metrics written to '{args.metrics_file}'.")
+
+
+if __name__ == "__main__":
+    main()
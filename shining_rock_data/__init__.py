@@ -0,0 +1,38 @@
+"""
+Data automation for Shining Rock Ventures: the DSIRE renewable-energy incentive ETL and
+Google Places lookups.
+
+Importing the package is cheap: the stage functions below are resolved on first access, and
+heavy dependencies (pandas, Selenium, BeautifulSoup, requests, aiohttp) are only imported by
+the stages that use them.
+
+    from shining_rock_data import run_dsire_etl
+    run_dsire_etl(fips_lookup_file="lookup.csv", output_file="out.xlsx", chunk_size=5000)
+"""
+import importlib
+
+__version__ = "0.1.0"
+
+_LAZY_EXPORTS = {
+    'run_dsire_etl': 'dsire_etl',
+    'text_search_places': 'places',
+    'get_place_details': 'places',
+    'search_place_records': 'places',
+    'AsyncPlacesClient': 'places_async',
+    'search_place_records_batch': 'places_async',
+    'METRICS': 'metrics',
+    'configure_logging': 'metrics',
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,209 @@
+"""
+Command-line interface.
+
+    python -m shining_rock_data etl [--fips-lookup-file FILE] [--output-file FILE] [--chunk-size N] ...
+    python -m shining_rock_data places search "Coffee shops in Tryon, NC" [--top 5] [--output FILE]
+    python -m shining_rock_data places batch queries.txt [--top 1] [--max-concurrency 100] [--qps 50]
+
+Options not given on the command line are read from the environment, then defaults
+(see config.py). Stage modules are imported only by the subcommand that runs them.
+"""
+import argparse
+import logging
+import sys
+import time
+
+from .config import DSIRE_SETTINGS, PLACES_SETTINGS, resolve_settings
+from .metrics import METRICS, configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def _common_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--log-level", default=None,
+                        help="DEBUG, INFO, WARNING or ERROR (default: $SRV_LOG_LEVEL or INFO).")
+    parser.add_argument("--log-json", action="store_true", default=None,
+                        help="Log one JSON object per line (default: $SRV_LOG_FORMAT=json).")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Write run metrics to this file at the end: JSON if it ends in .json, "
+                             "Prometheus text otherwise.")
+    return parser
+
+
+def _api_key_option(parser):
+    parser.add_argument("--api-key", default=None,
+                        help="Google Cloud API key with Places API enabled (default: $GOOGLE_PLACES_API_KEY).")
+
+
+def build_parser():
+    common = _common_options()
+    parser = argparse.ArgumentParser(prog="shining_rock_data", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    etl = commands.add_parser("etl", parents=[common], help="Run the full DSIRE ETL.")
+    for name, (env_var, default) in DSIRE_SETTINGS.items():
+        if name == 'metrics_file':
+            continue
+        etl.add_argument(f"--{name.replace('_', '-')}", dest=name, default=None,
+                         type=type(default) if isinstance(default, int) else str,
+                         help=f"(default: ${env_var} or {default!r})")
+    etl.set_defaults(handler=_run_etl)
+
+    places = commands.add_parser("places", help="Google Places lookups.")
+    places_commands = places.add_subparsers(dest="places_command", required=True)
+
+    search = places_commands.add_parser("search", parents=[common],
+                                        help="Look up one query and save details for its top matches.")
+    search.add_argument("query", nargs="?", help="Search text. Prompted for if omitted.")
+    _api_key_option(search)
+    search.add_argument("--top", type=int, default=5, help="Number of matches to fetch details for (default: 5).")
+    search.add_argument("--delay", type=float, default=0.1,
+                        help="Seconds between Place Details calls (default: 0.1).")
+    search.add_argument("--output", default="google_places_data.csv", help="CSV file to save results to.")
+    search.add_argument("--fields", default=None,
+                        help="Comma-separated record fields to print and save, e.g. 'Name,Address,Phone' "
+                             "(default: all fields of places.place_details_to_record).")
+    search.set_defaults(handler=_run_places_search)
+
+    batch = places_commands.add_parser("batch", parents=[common],
+                                       help="Look up many queries concurrently and save all matches to one CSV.")
+    batch.add_argument("queries_file", help="Text file with one query per line, or '-' for stdin.")
+    _api_key_option(batch)
+    batch.add_argument("--top", type=int, default=1, help="Number of matches per query to fetch details for (default: 1).")
+    batch.add_argument("--max-concurrency", type=int, default=None,
+                       help="Maximum requests in flight (default: $PLACES_MAX_CONCURRENCY or 100).")
+    batch.add_argument("--qps", type=float, default=None,
+                       help="Maximum requests started per second; 0 for no limit (default: $PLACES_QPS or 0).")
+    batch.add_argument("--output", default="google_places_batch_results.csv", help="CSV file to save results to.")
+    batch.set_defaults(handler=_run_places_batch)
+
+    return parser
+
+
+def _run_etl(args):
+    from .dsire_etl import run_dsire_etl
+
+    overrides = {name: getattr(args, name, None) for name in DSIRE_SETTINGS}
+    overrides['metrics_file'] = args.metrics_file
+    try:
+        settings = resolve_settings(DSIRE_SETTINGS, **overrides)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    rows_written = run_dsire_etl(**settings)
+    return 0 if rows_written is not None else 1
+
+
+def _places_settings(args, **overrides):
+    try:
+        settings = resolve_settings(PLACES_SETTINGS, api_key=args.api_key, metrics_file=args.metrics_file, **overrides)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return None
+    if not settings['api_key']:
+        print("No API key given. Pass --api-key or set GOOGLE_PLACES_API_KEY.", file=sys.stderr)
+        return None
+    settings['metrics_were_enabled'] = METRICS.enabled
+    if settings['metrics_file']:
+        # The metrics file covers this command only, even if main() is called repeatedly.
+        METRICS.reset()
+        METRICS.enable()
+    return settings
+
+
+def _write_places_metrics(settings):
+    # Called from a finally block, so metrics are written (and the registry restored) even
+    # when the command fails part way.
+    if not settings['metrics_file']:
+        return
+    try:
+        METRICS.write(settings['metrics_file'])
+        logger.info("Metrics written to: %s", settings['metrics_file'])
+    except OSError as e:
+        logger.error("Error writing metrics file %s: %s", settings['metrics_file'], e)
+    if not settings['metrics_were_enabled']:
+        METRICS.disable()
+
+
+def _save_records(records, output_path):
+    if not records:
+        print("\nNo business data collected to create a DataFrame or save to CSV.")
+        return
+
+    import pandas as pd
+
+    df = pd.DataFrame(records)
+    print("\n--- Pandas DataFrame Created ---")
+    print(df.head())
+    print(f"\nDataFrame shape: {df.shape}")
+
+    df.to_csv(output_path, index=False)
+    print(f"\n--- Data saved to '{output_path}' ---")
+
+
+def _run_places_search(args):
+    from .places import search_place_records
+
+    settings = _places_settings(args)
+    if settings is None:
+        return 2
+
+    try:
+        query = args.query or input("Enter the business name or search query (e.g., 'Coffee shops in Tryon, NC'): ")
+        records = search_place_records(query, settings['api_key'], max_results=args.top, delay=args.delay)
+        if args.fields:
+            fields = [field.strip() for field in args.fields.split(',') if field.strip()]
+            records = [{field: record.get(field, 'N/A') for field in fields} for record in records]
+
+        for record in records:
+            print()
+            for field, value in record.items():
+                if field == 'Total Ratings' and 'Rating' in record:
+                    continue
+                if field == 'Rating' and 'Total Ratings' in record:
+                    value = f"{value} (Total Ratings: {record['Total Ratings']})"
+                print(f" {field}: {value}")
+
+        _save_records(records, args.output)
+    finally:
+        _write_places_metrics(settings)
+    return 0 if records else 1
+
+
+def _run_places_batch(args):
+    from .places_async import search_place_records_batch
+
+    settings = _places_settings(args, max_concurrency=args.max_concurrency, qps=args.qps)
+    if settings is None:
+        return 2
+
+    try:
+        if args.queries_file == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.queries_file, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        queries = [line.strip() for line in lines if line.strip()]
+
+        start = time.perf_counter()
+        records = search_place_records_batch(
+            queries,
+            settings['api_key'],
+            max_results=args.top,
+            max_concurrency=settings['max_concurrency'],
+            qps=settings['qps'] or None,
+        )
+        print(f"Collected {len(records)} records for {len(queries)} queries in {time.perf_counter() - start:.1f} s.")
+
+        _save_records(records, args.output)
+    finally:
+        _write_places_metrics(settings)
+    return 0 if records else 1
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    configure_logging(args.log_level, args.log_json)
+    return args.handler(args)
@@ -0,0 +1,74 @@
+"""
+Run settings for the ETL and Places commands.
+
+Every setting is resolved in order from an explicit argument, then an environment variable,
+then the default below. Nothing is read or created at import time, so scheduler workers can
+import the package and pass settings per call.
+"""
+import os
+
+# setting name -> (environment variable, default)
+DSIRE_SETTINGS = {
+    'archive_page_url': ("DSIRE_ARCHIVE_PAGE_URL", "https://www.dsireusa.org/resources/database-archives/"),
+    # Parent of the private download directory each run creates (and removes when done).
+    # None uses the system temp directory.
+    'temp_dir': ("DSIRE_TEMP_DIR", None),
+    'fips_lookup_file': ("DSIRE_FIPS_LOOKUP_FILE", "appalachian_county_fips_lookup.csv"),
+    'output_file': ("DSIRE_OUTPUT_FILE", "Monthly_DSIRE_Appalachian_Cleaned.xlsx"),
+    'sheet_name': ("DSIRE_SHEET_NAME", "Appalachian_Master_DB"),
+    # None lets Selenium locate a matching chromedriver itself.
+    'chromedriver_path': ("DSIRE_CHROMEDRIVER_PATH", None),
+    # Rows per chunk for the streaming merge/clean mode; 0 processes everything in memory.
+    # One-to-many (dedupe=None) tables are still loaded whole; see run_chunked_merge_and_clean.
+    'chunk_size': ("DSIRE_CHUNK_SIZE", 0),
+    'prep_workers': ("DSIRE_PREP_WORKERS", 4),
+    # *.json for a JSON snapshot, any other path for Prometheus text format.
+    'metrics_file': ("DSIRE_METRICS_FILE", None),
+}
+
+PLACES_SETTINGS = {
+    'api_key': ("GOOGLE_PLACES_API_KEY", None),
+    'max_concurrency': ("PLACES_MAX_CONCURRENCY", 100),
+    'qps': ("PLACES_QPS", 0.0),
+    'metrics_file': ("PLACES_METRICS_FILE", None),
+}
+
+
+def resolve_settings(settings: dict, **overrides) -> dict:
+    """
+    Resolves every setting in `settings` (one of the *_SETTINGS dicts above).
+
+    Args:
+        settings (dict): Mapping of setting name to (environment variable, default).
+        **overrides: Explicit values. None means "not given" and falls through to the
+                     environment and then the default.
+
+    Returns:
+        dict: Setting name to value. Values from the environment are converted to the type
+              of the default when it is an int or float.
+
+    Raises:
+        TypeError: For a setting name that isn't in `settings`.
+        ValueError: For an environment value that can't be converted, naming the variable.
+    """
+    unknown = set(overrides) - set(settings)
+    if unknown:
+        raise TypeError(f"Unknown setting(s): {', '.join(sorted(unknown))}")
+
+    resolved = {}
+    for name, (env_var, default) in settings.items():
+        value = overrides.get(name)
+        if value is None:
+            env_value = os.environ.get(env_var)
+            if env_value is None or env_value == "":
+                value = default
+            elif isinstance(default, (int, float)) and not isinstance(default, bool):
+                try:
+                    value = type(default)(env_value)
+                except ValueError:
+                    raise ValueError(f"Environment variable {env_var}={env_value!r} is not a valid "
+                                     f"{type(default).__name__}.") from None
+            else:
+                value = env_value
+        resolved[name] = value
+    return resolved
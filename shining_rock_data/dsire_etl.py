@@ -0,0 +1,320 @@
+"""
+DSIRE ETL entry point: finds the latest DSIRE database export, downloads it, and builds the
+Appalachian county master sheet.
+
+Only the standard library is imported here. Selenium, BeautifulSoup, requests and pandas are
+imported when the stage that needs them runs, so this module is cheap to import.
+"""
+import datetime
+import io
+import logging
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from .config import DSIRE_SETTINGS, resolve_settings
+from .metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+def _log_frame(message, df):
+    # DataFrame rendering is expensive; only do it when DEBUG output is actually wanted.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s\n%s", message, df)
+
+
+def get_latest_dsire_zip_url(archive_page_url, driver_path=None):
+    try:
+        from bs4 import BeautifulSoup
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+    except ImportError:
+        logger.error("Required libraries 'beautifulsoup4' and 'selenium' not found. "
+                     "Please install them using: pip install beautifulsoup4 selenium")
+        return None
+
+    logger.info("Searching for latest DSIRE ZIP on: %s using Selenium...", archive_page_url)
+    
+    options = ChromeOptions()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+    service = ChromeService(executable_path=driver_path)
+    
+    driver = None
+    try:
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.get(archive_page_url)
+
+        wait = WebDriverWait(driver, 20)
+        wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, 'ncsolarcen-prod.s3.amazonaws.com/fullexports/dsire-')]")))
+        
+        page_source = driver.page_source
+        soup = BeautifulSoup(page_source, 'html.parser')
+
+        all_links = soup.find_all('a', href=True)
+
+        latest_zip_url = None
+        latest_month_year = None
+
+        for link in all_links:
+            href = link.get('href')
+            if href and "ncsolarcen-prod.s3.amazonaws.com/fullexports/dsire-" in href and href.endswith('.zip'):
+                logger.debug("Found S3 ZIP candidate: %s", href)
+
+                try:
+                    file_name = href.split('/')[-1] 
+                    month_year_part = file_name[6:13]
+                    
+                    current_link_date = datetime.datetime.strptime(month_year_part, "%Y-%m").date()
+                    
+                    if latest_month_year is None or current_link_date > latest_month_year:
+                        latest_month_year = current_link_date
+                        latest_zip_url = href
+                        logger.debug("New latest ZIP URL candidate based on date: %s", latest_zip_url)
+
+                except ValueError: 
+                    continue 
+                except Exception as e:
+                    continue 
+
+        if latest_zip_url:
+            logger.info("Found latest DSIRE ZIP URL: %s", latest_zip_url)
+            return latest_zip_url
+        else:
+            logger.warning("Could not find any suitable DSIRE ZIP link with the expected S3 URL and filename pattern after Selenium render. "
+                           "Please check the DSIRE archive page manually for changes to link patterns if this persists.")
+            return None
+
+    except TimeoutException:
+        logger.error("Selenium timed out waiting for the download links to appear. Page content might be taking too long to load.")
+        return None
+    except WebDriverException as e:
+        logger.error("Error with WebDriver (Selenium): %s. Please ensure chromedriver.exe is in the specified path "
+                     "and matches your Chrome browser version.", e)
+        return None
+    except Exception as e:
+        logger.exception("An unexpected error occurred during URL scraping (Selenium): %s", e)
+        return None
+    finally:
+        if driver:
+            driver.quit()
+
+def download_dsire_zip(zip_url, temp_dir):
+    """
+    Streams the DSIRE export ZIP to `temp_dir` and returns its local path, or None on failure.
+    """
+    if not zip_url:
+        logger.error("No ZIP URL provided for download.")
+        return None
+
+    import requests
+
+    logger.info("Downloading DSIRE ZIP from: %s", zip_url)
+    try:
+        os.makedirs(temp_dir, exist_ok=True)
+        response = requests.get(zip_url, stream=True)
+        response.raise_for_status()
+
+        zip_file_name = zip_url.split('/')[-1]
+        zip_file_path = os.path.join(temp_dir, zip_file_name)
+        with open(zip_file_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+        logger.info("Downloaded '%s' successfully.", zip_file_path)
+        return zip_file_path
+
+    except requests.exceptions.RequestException as e:
+        logger.error("Error downloading ZIP file: %s. Please check the URL and your internet connection.", e)
+        return None
+    except Exception as e:
+        logger.exception("An unexpected error occurred during download: %s", e)
+        return None
+
+
+def run_dsire_etl(**settings):
+    """
+    Runs the full DSIRE ETL: find the latest export, download it, join the tables onto the
+    Appalachian county lookup, clean, and save the master sheet.
+
+    Args:
+        **settings: Any of the names in config.DSIRE_SETTINGS, e.g. fips_lookup_file,
+                    output_file, chunk_size. Settings not given are read from the environment
+                    (DSIRE_*) or fall back to their defaults.
+
+    Returns:
+        int: Number of rows written, or None if the run was aborted.
+    """
+    settings = resolve_settings(DSIRE_SETTINGS, **settings)
+    metrics_were_enabled = METRICS.enabled
+    if settings['metrics_file']:
+        # The metrics file covers this run only, even when a worker runs the ETL repeatedly.
+        METRICS.reset()
+        METRICS.enable()
+
+    logger.info("--- Starting Full DSIRE ETL Process ---")
+    try:
+        with METRICS.timer("dsire_stage_seconds", stage="total"):
+            return _run_dsire_etl_stages(settings)
+    finally:
+        if settings['metrics_file']:
+            try:
+                METRICS.write(settings['metrics_file'])
+                logger.info("Metrics written to: %s", settings['metrics_file'])
+            except OSError as e:
+                logger.error("Error writing metrics file %s: %s", settings['metrics_file'], e)
+            if not metrics_were_enabled:
+                METRICS.disable()
+
+
+def _run_dsire_etl_stages(settings):
+    from . import dsire_tables
+
+    join_plan = dsire_tables.plan_dsire_joins(dsire_tables.DSIRE_TABLE_SPECS)
+
+    with METRICS.timer("dsire_stage_seconds", stage="scrape"):
+        zip_url = get_latest_dsire_zip_url(settings['archive_page_url'], settings['chromedriver_path'])
+    if zip_url is None:
+        logger.error("ETL process aborted: Could not find latest DSIRE ZIP URL.")
+        return None
+
+    # Each run downloads into its own new directory under temp_dir, so concurrent runs never
+    # share a ZIP and cleanup removes only what this run created.
+    try:
+        if settings['temp_dir']:
+            os.makedirs(settings['temp_dir'], exist_ok=True)
+        run_dir = tempfile.mkdtemp(prefix="dsire_", dir=settings['temp_dir'])
+    except OSError as e:
+        logger.error("ETL process aborted: could not create a download directory in %s: %s", settings['temp_dir'], e)
+        return None
+
+    try:
+        with METRICS.timer("dsire_stage_seconds", stage="download"):
+            zip_file_path = download_dsire_zip(zip_url, run_dir)
+        if zip_file_path is None:
+            logger.error("ETL process aborted due to download error.")
+            return None
+        return _merge_clean_and_save(settings, join_plan, zip_file_path)
+    finally:
+        _cleanup_temp_dir(run_dir)
+
+
+def _merge_clean_and_save(settings, join_plan, zip_file_path):
+    from . import dsire_tables
+
+    output_file = settings['output_file']
+    sheet_name = settings['sheet_name']
+
+    if settings['chunk_size']:
+        logger.info("Merging, cleaning and saving in chunks of %d rows to: %s (Sheet: '%s')",
+                    settings['chunk_size'], output_file, sheet_name)
+        try:
+            rows_written = dsire_tables.run_chunked_merge_and_clean(
+                zip_file_path, settings['fips_lookup_file'], output_file, sheet_name,
+                settings['chunk_size'], join_plan, settings['prep_workers'])
+        except ValueError as e:
+            logger.error("Chunked merge/clean not possible: %s", e)
+            rows_written = None
+        except Exception as e:
+            logger.exception("An error occurred during the chunked merge/clean/save: %s", e)
+            rows_written = None
+        if rows_written is None:
+            logger.error("ETL process aborted during chunked merge/clean.")
+            return None
+        logger.info("Cleaned and filtered data saved successfully! %d rows for Appalachian counties.", rows_written)
+        logger.info("--- Full DSIRE ETL Process Complete ---")
+        return rows_written
+
+    try:
+        with METRICS.timer("dsire_stage_seconds", stage="extract"):
+            prepared_tables = dsire_tables.prepare_dsire_tables(zip_file_path, join_plan,
+                                                                workers=settings['prep_workers'])
+    except KeyError as e:
+        logger.error("ETL process aborted: required DSIRE CSV missing: %s. "
+                     "Please ensure it exists in the DSIRE ZIP or mark its spec as not required.", e)
+        return None
+    except ValueError as e:
+        logger.error("ETL process aborted: DSIRE CSV does not match its table spec: %s", e)
+        return None
+    except zipfile.BadZipFile:
+        logger.error("ETL process aborted: Downloaded file is not a valid ZIP archive.")
+        return None
+    except Exception as e:
+        logger.exception("ETL process aborted: error loading DSIRE tables from zip: %s", e)
+        return None
+
+    try:
+        master_df = dsire_tables.load_appalachian_fips_lookup(settings['fips_lookup_file'])
+    except Exception:
+        logger.error("ETL process aborted: could not load the Appalachian FIPS lookup.")
+        return None
+
+    master_df.insert(0, 'ID', range(1, 1 + len(master_df)))
+    METRICS.set("dsire_rows", len(master_df), stage="lookup")
+
+    logger.info("Initial Master DataFrame based on Appalachian FIPS Lookup: %d rows, columns %s",
+                len(master_df), master_df.columns.tolist())
+    _log_frame("First 5 rows:", master_df.head())
+
+    try:
+        with METRICS.timer("dsire_stage_seconds", stage="merge"):
+            master_df = dsire_tables.join_dsire_tables(master_df, prepared_tables)
+    except KeyError as e:
+        logger.error("ETL process aborted: the FIPS lookup is missing a join column: %s", e)
+        return None
+    except ValueError as e:
+        logger.error("ETL process aborted: could not join the DSIRE tables: %s", e)
+        return None
+
+    METRICS.set("dsire_rows", len(master_df), stage="merge")
+    logger.info("Master DataFrame after all merges: %d rows, columns %s", len(master_df), master_df.columns.tolist())
+    if logger.isEnabledFor(logging.DEBUG):
+        info_buffer = io.StringIO()
+        master_df.info(buf=info_buffer)
+        logger.debug("%s", info_buffer.getvalue())
+
+    logger.info("--- Starting Comprehensive Data Cleaning and Transformation ---")
+    with METRICS.timer("dsire_stage_seconds", stage="clean"):
+        master_df = dsire_tables.clean_master_df(master_df, join_plan)
+
+    METRICS.set("dsire_rows", len(master_df), stage="clean")
+    _log_frame("Missing values after comprehensive cleaning and merging:", master_df.isnull().sum())
+
+    logger.info("Final DataFrame contains %d rows for Appalachian counties.", len(master_df))
+    _log_frame("First 5 rows of final Appalachian Master DB:", master_df.head())
+
+    # --- Output Cleaned and Filtered Data ---
+    logger.info("Saving cleaned and filtered data to: %s (Sheet: '%s')", output_file, sheet_name)
+    try:
+        with METRICS.timer("dsire_stage_seconds", stage="write"):
+            # Same writer as the chunked mode, so both accept .xlsx and .csv outputs.
+            rows_written = dsire_tables.write_output_chunks([master_df], output_file, sheet_name)
+        logger.info("Cleaned and filtered data saved successfully!")
+    except Exception as e:
+        logger.error("An error occurred while saving the output file: %s", e)
+        rows_written = None
+
+    logger.info("--- Full DSIRE ETL Process Complete ---")
+    return rows_written
+
+
+def _cleanup_temp_dir(temp_dir):
+    logger.info("Cleaning up temporary directory: %s", temp_dir)
+    try:
+        # Give a small delay to ensure all file handles are released
+        time.sleep(1)
+        shutil.rmtree(temp_dir)
+        logger.info("Temporary directory cleaned.")
+    except OSError as e:
+        logger.error("Error removing temporary directory %s: %s", temp_dir, e)
@@ -0,0 +1,620 @@
+"""
+DSIRE table stages: the declarative table specs and the pandas load, join, clean and write
+functions driven by them. Importing this module imports pandas; the ETL entry point in
+dsire_etl imports it only when a run starts.
+"""
+import logging
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from .metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREP_WORKERS = 4
+
+# Declarative description of every DSIRE export table merged into the master sheet.
+# Adding a table means adding an entry here; the load, join and clean stages are driven
+# entirely by this list. Keys:
+#   table           CSV name inside the ZIP, without '.csv'.
+#   columns         Columns to read from the CSV (must include join_key). Nothing else is loaded.
+#   renames         Column renames applied before the join.
+#   join_key        Key column in this table (default 'state_id').
+#   master_key      Column of the master to join on (default 'State ID'). May be a column
+#                   brought in by an earlier table in this list.
+#   key_type        'int' (coerced to int, unparseable keys become -1) or 'str' (default 'int').
+#   dedupe          'first' or 'last' to keep one row per key, or None to keep every row
+#                   (a one-to-many join that adds master rows) (default 'first'). In chunked
+#                   mode a dedupe=None table is held in memory whole (its spec columns only)
+#                   and each master chunk is fanned out to its matches.
+#   suffix          Appended to columns whose names clash with the master (default '_<table>').
+#   required        Abort the ETL if the table, or one of its columns, is missing from the
+#                   ZIP (default True). Otherwise the table is skipped with a warning.
+#   text_columns    Renamed columns to strip HTML and whitespace from.
+#   numeric_columns Renamed columns to convert to numbers, filling blanks with 0.
+#   output_columns  Renamed columns to add to the output sheet after OUTPUT_COLUMNS.
+DSIRE_TABLE_SPECS = [
+    {
+        'table': 'program',
+        'columns': ['state_id', 'name', 'code', 'summary', 'websiteurl', 'administrator', 'fundingsource', 'budget'],
+        'renames': {
+            'name': 'Program Name',
+            'code': 'Code',
+            'summary': 'Program Summary',
+            'websiteurl': 'Program Website URL',
+            'administrator': 'Administrator',
+            'fundingsource': 'Funding Source',
+            'budget': 'Budget'
+        },
+        'suffix': '_program_data',
+        'text_columns': ['Program Summary', 'Program Website URL', 'Administrator', 'Funding Source', 'Budget'],
+        'numeric_columns': ['Budget'],
+    },
+    {
+        'table': 'state_info_content',
+        'columns': ['state_id', 'introduction', 'history', 'renewable_portfolio_standard', 'organizations', 'programs', 'footnotes'],
+        'renames': {
+            'introduction': 'State Info Intro',
+            'history': 'State Info History',
+            'renewable_portfolio_standard': 'Renewable Portfolio Standard',
+            'organizations': 'Organizations',
+        },
+        'suffix': '_stateinfo',
+        'text_columns': ['State Info Intro', 'State Info History', 'Renewable Portfolio Standard', 'Organizations'],
+    },
+    {
+        'table': 'contact',
+        'columns': ['state_id', 'first_name', 'last_name', 'organization_name', 'phone', 'email', 'website_url', 'address', 'city', 'zip'],
+        'renames': {
+            'first_name': 'Contact First Name',
+            'last_name': 'Contact Last Name',
+            'organization_name': 'Contact Organization Name',
+            'phone': 'Contact Phone',
+            'email': 'Contact Email',
+            'website_url': 'Contact Website URL',
+            'address': 'Contact Address',
+            'city': 'Contact City',
+            'zip': 'Contact Zip'
+        },
+        'suffix': '_contact',
+        'text_columns': [
+            'Contact Organization Name', 'Contact Phone', 'Contact Email', 'Contact Website URL',
+            'Contact Address', 'Contact City', 'Contact Zip'
+        ],
+    },
+]
+
+# Excel file has columns in a specific order.
+OUTPUT_COLUMNS = [
+    'ID', 'County', 'State ID', 'FIPS', 'State',
+    'Program Name', 'Code', 'Program Website URL', 'Program Summary',
+    'State Info Intro', 'State Info History', 'Renewable Portfolio Standard',
+    'Administrator', 'Funding Source', 'Budget', 'Organizations',
+    'Contact First Name', 'Contact Last Name', 'Contact Organization Name',
+    'Contact Phone', 'Contact Email', 'Contact Website URL',
+    'Contact Address', 'Contact City', 'Contact Zip',
+    'Is_Appalachian'
+]
+
+
+def _clean_fips_lookup(lookup_df):
+    lookup_df.rename(columns={
+        'COUNTY': 'County',
+        'State ID': 'State ID',
+        'STATE': 'State',
+        'FIPS': 'FIPS',
+        'Is_Appalachian': 'Is_Appalachian'
+    }, inplace=True, errors='ignore')
+
+    for col in ['County', 'State']:
+        if col in lookup_df.columns:
+            lookup_df[col] = lookup_df[col].astype(str).str.strip().str.title()
+
+    if 'FIPS' in lookup_df.columns:
+        lookup_df['FIPS'] = lookup_df['FIPS'].astype(str).str.strip().str.zfill(5)
+
+    if 'State ID' in lookup_df.columns:
+        lookup_df['State ID'] = pd.to_numeric(lookup_df['State ID'], errors='coerce')
+        lookup_df.dropna(subset=['State ID'], inplace=True)
+        lookup_df['State ID'] = lookup_df['State ID'].astype(int)
+
+    return lookup_df
+
+def load_appalachian_fips_lookup(file_path):
+    logger.info("Loading Appalachian FIPS lookup from: %s", file_path)
+    try:
+        lookup_df = pd.read_csv(file_path, encoding='utf-8')
+        return _clean_fips_lookup(lookup_df)
+    except FileNotFoundError:
+        logger.error("Appalachian FIPS lookup file '%s' not found. "
+                     "Please create this file with COUNTY, State ID, STATE, FIPS, Is_Appalachian columns.", file_path)
+        raise
+    except Exception as e:
+        logger.error("Error loading Appalachian FIPS lookup file: %s", e)
+        raise
+
+
+# --- Table spec driven load, join and clean ---
+
+_TABLE_SPEC_DEFAULTS = {
+    'join_key': 'state_id',
+    'master_key': 'State ID',
+    'key_type': 'int',
+    'dedupe': 'first',
+    'required': True,
+    'renames': {},
+    'text_columns': [],
+    'numeric_columns': [],
+    'output_columns': [],
+}
+
+
+# Columns of the county master before any table is joined: the cleaned FIPS lookup plus ID.
+MASTER_COLUMNS = ['ID', 'County', 'State ID', 'State', 'FIPS', 'Is_Appalachian']
+
+
+def plan_dsire_joins(specs, master_columns=MASTER_COLUMNS):
+    """
+    Validates the table specs and fills in their defaults. Returns the join plan: one complete
+    spec per table, in join order.
+
+    Each master_key must be one of `master_columns` or a column added by an earlier spec,
+    under the name it has after the join (clashing names get '_master' and the suffix, as
+    in join_dsire_tables). Raises ValueError for an invalid spec.
+    """
+    join_plan = []
+    names = list(master_columns)
+    for spec in specs:
+        spec = {**_TABLE_SPEC_DEFAULTS, 'suffix': f"_{spec['table']}", **spec}
+        key = spec['join_key']
+        if key not in spec['columns']:
+            raise ValueError(f"Table spec '{spec['table']}': join_key '{key}' must be listed in columns.")
+        if key in spec['renames']:
+            raise ValueError(f"Table spec '{spec['table']}': join_key '{key}' cannot be renamed.")
+        if spec['dedupe'] not in ('first', 'last', None):
+            raise ValueError(f"Table spec '{spec['table']}': dedupe must be 'first', 'last' or None.")
+        if spec['key_type'] not in ('int', 'str'):
+            raise ValueError(f"Table spec '{spec['table']}': key_type must be 'int' or 'str'.")
+        if spec['master_key'] not in names:
+            raise ValueError(f"Table spec '{spec['table']}': master_key '{spec['master_key']}' is not a lookup "
+                             f"column or a column added by an earlier table spec.")
+
+        right_names = [spec['renames'].get(col, col) for col in spec['columns'] if col != key]
+        overlap = set(names) & set(right_names)
+        names = [name + '_master' if name in overlap else name for name in names]
+        names += [name + spec['suffix'] if name in overlap else name for name in right_names]
+        join_plan.append(spec)
+    return join_plan
+
+def _coerce_join_key(values, key_type):
+    if key_type == 'int':
+        return pd.to_numeric(values, errors='coerce').fillna(-1).astype(int)
+    return values.astype(str).str.strip()
+
+def _coerce_master_keys(values, key_type):
+    # Converts the master's key column to the table's key_type, so a 'str' table can join on
+    # the int State ID and vice versa. Unlike _coerce_join_key, missing or unparseable keys
+    # become NaN, which matches no row.
+    if key_type == 'int':
+        return pd.to_numeric(values, errors='coerce')
+    if values.dtype.kind == 'f' and (values.dropna() % 1 == 0).all():
+        values = values.astype('Int64')  # whole numbers made float by a NaN: '5', not '5.0'
+    return values.astype(str).str.strip().where(values.notna()).astype(object)
+
+
+# Reading in chunks changes pandas' dtype inference: a column that is all integers in one
+# chunk but has a blank or a word elsewhere in the file would come back as int64 in that
+# chunk, and "28801" instead of "28801.0" or the original text after astype(str). To keep
+# the output identical to the in-memory run, chunked CSVs are read as strings and each column
+# is converted afterwards according to what pandas would have inferred for the whole file.
+
+_TRUE_STRINGS = {'True', 'TRUE', 'true'}
+_FALSE_STRINGS = {'False', 'FALSE', 'false'}
+
+
+def _update_dtype_plan(plan, chunk):
+    for col in chunk.columns:
+        state = plan.setdefault(col, {'seen': False, 'null': False, 'bool': True, 'numeric': True, 'float': False})
+        non_null = chunk[col].dropna()
+        state['null'] = state['null'] or len(non_null) < len(chunk)
+        if len(non_null) == 0:
+            continue
+        state['seen'] = True
+        if state['bool']:
+            state['bool'] = bool(non_null.isin(_TRUE_STRINGS | _FALSE_STRINGS).all())
+        if state['numeric']:
+            converted = pd.to_numeric(non_null, errors='coerce')
+            if converted.isna().any():
+                state['numeric'] = False
+            elif converted.dtype.kind == 'f':
+                state['float'] = True
+    return plan
+
+def _apply_dtype_plan(df, plan):
+    for col, state in plan.items():
+        if col not in df.columns:
+            continue
+        if not state['seen']:
+            df[col] = df[col].astype(float)
+        elif state['bool']:
+            mapped = df[col].map(lambda v: v in _TRUE_STRINGS if isinstance(v, str) else v)
+            df[col] = mapped.astype(object) if state['null'] else mapped.astype(bool)
+        elif state['numeric']:
+            converted = pd.to_numeric(df[col])
+            df[col] = converted.astype(float) if state['null'] or state['float'] else converted
+    return df
+
+
+def prepare_merge_table(df, spec):
+    """
+    Reduces one loaded DSIRE table to its spec: join key coerced, columns selected and renamed,
+    and deduplicated per the spec's policy. Returns None if the table has no join key column.
+    """
+    key = spec['join_key']
+    if key not in df.columns:
+        logger.warning("'%s' column not found in %s.csv. Skipping %s merge.", key, spec['table'], spec['table'])
+        return None
+
+    df[key] = _coerce_join_key(df[key], spec['key_type'])
+    data_to_merge = df[spec['columns']].rename(columns=spec['renames'], errors='ignore')
+    if spec['dedupe']:
+        data_to_merge = data_to_merge.drop_duplicates(subset=[key], keep=spec['dedupe'])
+    return data_to_merge
+
+def _stream_merge_table(f, spec, wanted, chunk_size):
+    # Same result as read_csv + prepare_merge_table. A deduplicated table holds at most one
+    # chunk plus one row per key in memory; a dedupe=None table keeps every row, collected
+    # chunk by chunk and concatenated once.
+    key = spec['join_key']
+    plan = {}
+    kept = None
+    all_chunks = []
+    rows_read = 0
+
+    reader = pd.read_csv(f, encoding='utf-8', usecols=lambda c: c in wanted, dtype=str, chunksize=chunk_size)
+    for chunk in reader:
+        if key not in chunk.columns:
+            logger.warning("'%s' column not found in %s.csv. Skipping %s merge.", key, spec['table'], spec['table'])
+            return None, rows_read
+        rows_read += len(chunk)
+        _update_dtype_plan(plan, chunk.drop(columns=[key]))
+        chunk[key] = _coerce_join_key(chunk[key], spec['key_type'])
+
+        if spec['dedupe']:
+            kept = chunk if kept is None else pd.concat([kept, chunk], ignore_index=True)
+            kept = kept.drop_duplicates(subset=[key], keep=spec['dedupe'])
+        else:
+            all_chunks.append(chunk)
+
+    if all_chunks:
+        kept = pd.concat(all_chunks, ignore_index=True)
+
+    if kept is None:
+        # Header-only CSV: match what read_csv returns for it in memory.
+        kept = pd.DataFrame(columns=spec['columns'], dtype=object)
+        kept[key] = _coerce_join_key(kept[key], spec['key_type'])
+
+    data_to_merge = _apply_dtype_plan(kept.reset_index(drop=True), plan)
+    return data_to_merge[spec['columns']].rename(columns=spec['renames'], errors='ignore'), rows_read
+
+def load_dsire_table(zip_file_path, spec, chunk_size=None):
+    """
+    Loads one table from the DSIRE ZIP, reading only the columns in its spec, and returns it
+    prepared for the join (see prepare_merge_table). With `chunk_size`, the CSV is streamed
+    instead of loaded whole.
+
+    Returns None if the table has no join key column, or is optional and missing from the ZIP
+    or missing one of its spec columns. For a required table, raises KeyError if it is missing
+    from the ZIP and ValueError if it is missing a spec column.
+    """
+    csv_name = f"{spec['table']}.csv"
+    wanted = set(spec['columns'])
+
+    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+        try:
+            f = zip_ref.open(csv_name)
+        except KeyError:
+            if spec['required']:
+                raise KeyError(f"'{csv_name}' not found in the ZIP file.") from None
+            logger.warning("'%s' not found in the ZIP file. Skipping.", csv_name)
+            return None
+
+        with f:
+            header = pd.read_csv(f, encoding='utf-8', nrows=0).columns
+            f.seek(0)
+            missing = [col for col in spec['columns'] if col not in header]
+            if missing and spec['join_key'] not in missing:
+                message = f"'{csv_name}' is missing column(s) listed in its table spec: {', '.join(missing)}"
+                if spec['required']:
+                    raise ValueError(message)
+                logger.warning("%s. Skipping.", message)
+                return None
+
+            if chunk_size:
+                data_to_merge, rows_read = _stream_merge_table(f, spec, wanted, chunk_size)
+            else:
+                # String keys are compared as written in the CSV, in both modes.
+                dtype = {spec['join_key']: str} if spec['key_type'] == 'str' else None
+                df = pd.read_csv(f, encoding='utf-8', usecols=lambda c: c in wanted, dtype=dtype, low_memory=False)
+                rows_read = len(df)
+                data_to_merge = prepare_merge_table(df, spec)
+
+    METRICS.set("dsire_rows", rows_read, stage="extract", table=spec['table'])
+    logger.info("Loaded '%s' (%d rows, %d kept for the join).", csv_name, rows_read,
+                0 if data_to_merge is None else len(data_to_merge))
+    return data_to_merge
+
+def prepare_dsire_tables(zip_file_path, join_plan, chunk_size=None, workers=DEFAULT_PREP_WORKERS):
+    """
+    Loads and prepares every table in the join plan, `workers` tables at a time. Each worker
+    opens the ZIP on its own. Returns (spec, DataFrame) pairs in plan order, leaving out
+    tables that were skipped.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(load_dsire_table, zip_file_path, spec, chunk_size) for spec in join_plan]
+        results = [future.result() for future in futures]
+    return [(spec, data_to_merge) for spec, data_to_merge in zip(join_plan, results) if data_to_merge is not None]
+
+_JOIN_KEY_COLUMN = '__join_key'
+_MASTER_KEY_COLUMN = '__master_key'
+
+
+def _combine_blocks(blocks, names):
+    combined = pd.concat(blocks, axis=1) if len(blocks) > 1 else blocks[0]
+    combined.columns = names
+    return combined
+
+def join_dsire_tables(master_df, prepared_tables, seen_keys=None):
+    """
+    Left-joins each prepared (spec, DataFrame) pair onto the master in plan order, like a
+    chain of pd.merge(..., how='left') calls: master row order is kept, and clashing column
+    names get '_master' and the table's suffix. The table's own join key column is not kept,
+    since it equals the master key wherever a row matched; this lets any number of tables
+    share a key name such as state_id.
+
+    Tables with one row per key are looked up by index and all added in one concat at the end,
+    so each extra table costs a pass over its own columns instead of another full copy of the
+    master. Tables with dedupe=None can add rows and go through pd.merge.
+
+    Master keys are converted to each table's key_type before the lookup.
+
+    If `seen_keys` is a dict, seen_keys[table name] collects the master key values the table is
+    looked up with ('keys') and whether any master row had no key at all ('missing').
+    """
+    blocks = [master_df.reset_index(drop=True)]
+    names = list(blocks[0].columns)
+    sources = [(0, name) for name in names]  # (block index, column in that block) per name
+
+    for spec, data_to_merge in prepared_tables:
+        if spec['master_key'] not in names:
+            raise KeyError(f"Master key '{spec['master_key']}' for table '{spec['table']}' is not a master column.")
+        block_index, column = sources[names.index(spec['master_key'])]
+        master_keys = _coerce_master_keys(blocks[block_index][column], spec['key_type'])
+        if seen_keys is not None:
+            seen = seen_keys.setdefault(spec['table'], {'keys': set(), 'missing': False})
+            seen['keys'].update(master_keys.dropna().unique())
+            # e.g. rows that found no match in the earlier table this key comes from
+            seen['missing'] = seen['missing'] or bool(master_keys.isna().any())
+
+        if spec['dedupe'] is None:
+            merged = pd.merge(
+                _combine_blocks(blocks, names).assign(**{_MASTER_KEY_COLUMN: master_keys.to_numpy()}),
+                data_to_merge.rename(columns={spec['join_key']: _JOIN_KEY_COLUMN}),
+                left_on=_MASTER_KEY_COLUMN,
+                right_on=_JOIN_KEY_COLUMN,
+                how='left',
+                suffixes=('_master', spec['suffix'])
+            ).drop(columns=[_MASTER_KEY_COLUMN, _JOIN_KEY_COLUMN])
+            blocks = [merged]
+            names = list(merged.columns)
+            sources = [(0, name) for name in names]
+        else:
+            right = data_to_merge.set_index(spec['join_key']).reindex(master_keys.to_numpy())
+            right.index = blocks[0].index
+
+            right_names = list(right.columns)
+            overlap = set(names) & set(right_names)
+            names = [name + '_master' if name in overlap else name for name in names]
+            names += [name + spec['suffix'] if name in overlap else name for name in right_names]
+            blocks.append(right)
+            sources += [(len(blocks) - 1, name) for name in right_names]
+        logger.debug("Joined %s data on '%s'.", spec['table'], spec['master_key'])
+
+    return _combine_blocks(blocks, names)
+
+def clean_master_df(master_df, join_plan):
+    """
+    Strips HTML, fills missing values and puts the columns in the order of the Excel sheet,
+    using the text/numeric/output columns declared in the join plan. Every step works row by
+    row, so it can run on chunks of the master.
+    """
+    # Remove HTML tags and strip whitespace from relevant text columns
+    text_columns_to_clean = list(dict.fromkeys(col for spec in join_plan for col in spec['text_columns']))
+    for col in text_columns_to_clean:
+        if col in master_df.columns:
+            master_df[col] = master_df[col].astype(str).str.replace(r'<[^>]*>', '', regex=True)
+            master_df[col] = master_df[col].str.strip()
+            master_df[col] = master_df[col].replace('nan', '', regex=False)
+            logger.debug("Cleaned HTML, whitespace, and 'nan' from '%s'.", col)
+
+    # Handle Missing Values
+    for col in master_df.columns:
+        if master_df[col].dtype == 'object':
+            master_df[col] = master_df[col].fillna('Not Specified').astype(str).replace('nan', 'Not Specified')
+
+    numeric_cols_to_fill_zero = list(dict.fromkeys(col for spec in join_plan for col in spec['numeric_columns']))
+    for col in numeric_cols_to_fill_zero:
+        if col in master_df.columns:
+            # Always float, so the dtype doesn't depend on whether this chunk happened to have blanks.
+            master_df[col] = pd.to_numeric(master_df[col], errors='coerce').fillna(0).astype(float) # Fill numeric NaNs with 0
+            logger.debug("Filled missing numeric values in '%s' with 0.", col)
+
+    # Final FIPS code cleanup (ensure it's a 5-digit string)
+    if 'FIPS' in master_df.columns:
+        master_df['FIPS'] = master_df['FIPS'].astype(str).str.strip().str.zfill(5).replace('Not Specified', '')
+        logger.debug("Ensured 'FIPS' is a 5-digit string.")
+    else:
+        logger.warning("'FIPS' column not found after FIPS merge. FIPS might be missing in output.")
+
+    desired_order = list(dict.fromkeys(OUTPUT_COLUMNS + [col for spec in join_plan for col in spec['output_columns']]))
+
+    # adding any missing as 'Not Specified' if they should be
+    for col in desired_order:
+        if col not in master_df.columns:
+            master_df[col] = 'Not Specified'
+            logger.debug("Added missing desired column '%s' with 'Not Specified' values.", col)
+
+    # Raw DSIRE columns and join keys left over from the merges are dropped here.
+    return master_df[desired_order].copy()
+
+
+# --- Chunked (out-of-core) merge and clean ---
+
+def _widen_for_unmatched_rows(data_to_merge, spec, seen):
+    # In a single in-memory merge, any master row without a match introduces NaN into the
+    # joined columns, turning int columns into float and bool columns into object. A chunk
+    # whose rows all match would keep the narrower dtype, so widen up front when needed.
+    # `seen` is the table's entry from join_dsire_tables' seen_keys.
+    if not seen['missing'] and seen['keys'] <= set(data_to_merge[spec['join_key']]):
+        return data_to_merge
+    for col in data_to_merge.columns:
+        if col == spec['join_key']:
+            continue
+        kind = data_to_merge[col].dtype.kind
+        if kind in 'iu':
+            data_to_merge[col] = data_to_merge[col].astype(float)
+        elif kind == 'b':
+            data_to_merge[col] = data_to_merge[col].astype(object)
+    return data_to_merge
+
+def scan_fips_lookup(file_path, chunk_size):
+    """
+    First pass over the lookup: returns the dtype plan pandas would infer for the whole file.
+    """
+    plan = {}
+    try:
+        for chunk in pd.read_csv(file_path, encoding='utf-8', dtype=str, chunksize=chunk_size):
+            _update_dtype_plan(plan, chunk)
+    except FileNotFoundError:
+        logger.error("Appalachian FIPS lookup file '%s' not found. "
+                     "Please create this file with COUNTY, State ID, STATE, FIPS, Is_Appalachian columns.", file_path)
+        raise
+    return plan
+
+def iter_fips_lookup_chunks(file_path, plan, chunk_size):
+    for chunk in pd.read_csv(file_path, encoding='utf-8', dtype=str, chunksize=chunk_size):
+        yield _clean_fips_lookup(_apply_dtype_plan(chunk, plan))
+
+def _write_excel_chunks(chunks, output_path, sheet_name):
+    # openpyxl's write-only mode streams rows to disk as they are appended, where
+    # pd.ExcelWriter builds the whole workbook in memory first. Header style and blank cells
+    # match DataFrame.to_excel.
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    thin = Side(style='thin')
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    rows_written = 0
+    first = True
+
+    for chunk in chunks:
+        if first:
+            header = []
+            for name in chunk.columns:
+                cell = WriteOnlyCell(sheet, value=name)
+                cell.font = Font(bold=True)
+                cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+                cell.alignment = Alignment(horizontal='center', vertical='top')
+                header.append(cell)
+            sheet.append(header)
+            first = False
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(['' if pd.isna(value) else value for value in row])
+        rows_written += len(chunk)
+
+    workbook.save(output_path)
+    return rows_written
+
+def write_output_chunks(chunks, output_path, sheet_name):
+    """
+    Writes DataFrame chunks one after another to a single sheet (or CSV file if `output_path`
+    ends in .csv). Either way rows go to disk as each chunk arrives, so memory use does not
+    grow with the number of rows. Returns the number of data rows written.
+    """
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+    if not output_path.lower().endswith('.csv'):
+        return _write_excel_chunks(chunks, output_path, sheet_name)
+
+    rows_written = 0
+    first = True
+    for chunk in chunks:
+        chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+        rows_written += len(chunk)
+        first = False
+    if first:
+        open(output_path, 'w').close()
+    return rows_written
+
+def run_chunked_merge_and_clean(zip_file_path, lookup_file_path, output_path, sheet_name, chunk_size, join_plan,
+                                workers=DEFAULT_PREP_WORKERS):
+    """
+    Streaming equivalent of the in-memory load, join, clean and save stages. The DSIRE tables
+    are read chunk by chunk (only the needed columns) and reduced per their specs, then the
+    county master is joined, cleaned and written `chunk_size` rows at a time, so peak memory
+    does not grow with the size of the export or the lookup.
+
+    Tables with dedupe=None (e.g. every program for every county) are the exception: each is
+    held in memory whole, reduced to its spec columns, and every master chunk is fanned out to
+    its matching rows, so a written chunk can hold more than `chunk_size` rows. Memory then
+    grows with the size of those tables but not with the size of the joined output.
+
+    Returns the number of rows written, or None if a required table or column is missing.
+    """
+    lookup_plan = scan_fips_lookup(lookup_file_path, chunk_size)
+
+    try:
+        prepared_tables = prepare_dsire_tables(zip_file_path, join_plan, chunk_size, workers)
+    except KeyError as e:
+        logger.error("Required DSIRE CSV missing: %s", e)
+        return None
+    except ValueError as e:
+        logger.error("DSIRE CSV does not match its table spec: %s", e)
+        return None
+    except zipfile.BadZipFile:
+        logger.error("Downloaded file is not a valid ZIP archive.")
+        return None
+
+    # Int/bool columns must be widened exactly when the full join would leave some master row
+    # unmatched, which takes one key-only pass over the master to find out.
+    if any(df[col].dtype.kind in 'iub' for _, df in prepared_tables for col in df.columns):
+        seen_keys = {}
+        for lookup_chunk in iter_fips_lookup_chunks(lookup_file_path, lookup_plan, chunk_size):
+            join_dsire_tables(lookup_chunk, prepared_tables, seen_keys)
+        prepared_tables = [
+            (spec, _widen_for_unmatched_rows(data_to_merge, spec,
+                                             seen_keys.get(spec['table'], {'keys': set(), 'missing': False})))
+            for spec, data_to_merge in prepared_tables
+        ]
+
+    def _cleaned_chunks():
+        next_id = 1
+        for lookup_chunk in iter_fips_lookup_chunks(lookup_file_path, lookup_plan, chunk_size):
+            lookup_chunk.insert(0, 'ID', range(next_id, next_id + len(lookup_chunk)))
+            next_id += len(lookup_chunk)
+
+            with METRICS.timer("dsire_stage_seconds", stage="merge"):
+                master_chunk = join_dsire_tables(lookup_chunk, prepared_tables)
+            with METRICS.timer("dsire_stage_seconds", stage="clean"):
+                master_chunk = clean_master_df(master_chunk, join_plan)
+            logger.debug("Processed %d master rows.", len(master_chunk))
+            yield master_chunk
+
+    rows_written = write_output_chunks(_cleaned_chunks(), output_path, sheet_name)
+    METRICS.set("dsire_rows", rows_written, stage="clean")
+    return rows_written
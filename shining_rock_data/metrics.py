@@ -0,0 +1,290 @@
+"""
+Structured logging and in-process metrics shared by the DSIRE ETL and Google Places modules.
+
+Logging goes through the standard `logging` module. `configure_logging()` installs either a
+plain-text or a one-JSON-object-per-line formatter; anything passed via `extra=` is included
+as structured fields in JSON mode.
+
+Metrics are collected in the module-level `METRICS` registry:
+    METRICS.inc("places_requests_total", api="text_search", status="OK")
+    METRICS.observe("places_request_seconds", 0.123, api="text_search")
+    METRICS.set("dsire_rows", 423, stage="merge")
+
+Histograms keep exact count, sum, min and max, and a fixed-size uniform sample of the
+observations for quantiles, so memory stays constant however many calls are recorded.
+
+The registry is disabled by default and every recording call returns immediately in that
+case, so instrumented code costs a single attribute check when metrics are off.
+Call `METRICS.enable()` and, at the end of a run, `METRICS.write(path)` to export a JSON
+snapshot (*.json) or a Prometheus text file (anything else).
+"""
+import json
+import logging
+import math
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+LOG_LEVEL_ENV = "SRV_LOG_LEVEL"
+LOG_FORMAT_ENV = "SRV_LOG_FORMAT"
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+# Samples kept per histogram for quantile estimates.
+DEFAULT_RESERVOIR_SIZE = 1024
+
+_STANDARD_LOG_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as a single JSON line, including any fields passed via `extra=`.
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_LOG_RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level: str = None, json_format: bool = None, stream=None):
+    """
+    Configures the root logger for a script run.
+
+    Args:
+        level (str, optional): Log level name, e.g. 'DEBUG' or 'WARNING'. Defaults to the
+                               SRV_LOG_LEVEL environment variable, or 'INFO'.
+        json_format (bool, optional): Emit one JSON object per line. Defaults to True when
+                                      SRV_LOG_FORMAT=json.
+        stream (optional): Output stream. Defaults to sys.stderr.
+    """
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, "INFO")
+    if json_format is None:
+        json_format = os.environ.get(LOG_FORMAT_ENV, "").lower() == "json"
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if json_format:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _quantile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    index = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class _Histogram:
+    """
+    Running count, sum, min and max plus a bounded reservoir sample (Algorithm R) of the
+    observed values. Quantiles are exact until `reservoir_size` samples have been seen.
+    """
+
+    __slots__ = ("count", "sum", "min", "max", "samples", "_reservoir_size", "_rng")
+
+    def __init__(self, reservoir_size: int):
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.samples = []
+        self._reservoir_size = reservoir_size
+        self._rng = random.Random(0)
+
+    def add(self, value: float):
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self.samples) < self._reservoir_size:
+            self.samples.append(value)
+        else:
+            index = self._rng.randrange(self.count)
+            if index < self._reservoir_size:
+                self.samples[index] = value
+
+    def summary(self) -> dict:
+        return {"count": self.count, "sum": self.sum, "min": self.min, "max": self.max,
+                "samples": sorted(self.samples)}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe in-process store of counters, gauges and histograms keyed by name and labels.
+    """
+
+    def __init__(self, enabled: bool = False, reservoir_size: int = DEFAULT_RESERVOIR_SIZE):
+        self.enabled = enabled
+        self.reservoir_size = reservoir_size
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Adds `value` to a counter."""
+        if not self.enabled:
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Sets a gauge to `value`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Records one sample in a histogram (e.g. a latency in seconds)."""
+        if not self.enabled:
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.reservoir_size)
+            histogram.add(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Context manager that observes the elapsed wall time of its block in seconds."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def snapshot(self, quantiles=DEFAULT_QUANTILES) -> dict:
+        """
+        Returns all recorded metrics as a JSON-serialisable dict. Histograms are summarised
+        as count, sum, min, max and the requested quantiles (estimated from the reservoir
+        sample once more than `reservoir_size` values have been observed).
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {key: histogram.summary() for key, histogram in self._histograms.items()}
+
+        def _entries(store, summarise=lambda v: v):
+            return [
+                {"name": name, "labels": dict(labels), "value": summarise(value)}
+                for (name, labels), value in sorted(store.items())
+            ]
+
+        def _summary(histogram):
+            return {
+                "count": histogram["count"],
+                "sum": histogram["sum"],
+                "min": histogram["min"],
+                "max": histogram["max"],
+                "quantiles": {str(q): _quantile(histogram["samples"], q) for q in quantiles},
+            }
+
+        return {
+            "generated_at": time.time(),
+            "counters": _entries(counters),
+            "gauges": _entries(gauges),
+            "histograms": _entries(histograms, _summary),
+        }
+
+    def to_prometheus(self, quantiles=DEFAULT_QUANTILES) -> str:
+        """
+        Renders all recorded metrics in the Prometheus text exposition format. Histograms are
+        exported as summaries.
+        """
+        snapshot = self.snapshot(quantiles)
+        lines = []
+
+        def _labels(labels, **extra):
+            merged = {**labels, **extra}
+            if not merged:
+                return ""
+            body = ",".join(
+                '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+                for k, v in merged.items()
+            )
+            return "{" + body + "}"
+
+        def _emit(entries, metric_type, render):
+            seen = set()
+            for entry in entries:
+                if entry["name"] not in seen:
+                    lines.append(f"# TYPE {entry['name']} {metric_type}")
+                    seen.add(entry["name"])
+                render(entry)
+
+        _emit(snapshot["counters"], "counter",
+              lambda e: lines.append(f"{e['name']}{_labels(e['labels'])} {e['value']}"))
+        _emit(snapshot["gauges"], "gauge",
+              lambda e: lines.append(f"{e['name']}{_labels(e['labels'])} {e['value']}"))
+
+        def _render_summary(e):
+            summary = e["value"]
+            for q, v in summary["quantiles"].items():
+                lines.append(f"{e['name']}{_labels(e['labels'], quantile=q)} {v}")
+            lines.append(f"{e['name']}_sum{_labels(e['labels'])} {summary['sum']}")
+            lines.append(f"{e['name']}_count{_labels(e['labels'])} {summary['count']}")
+
+        _emit(snapshot["histograms"], "summary", _render_summary)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """
+        Writes the current metrics to `path`: a JSON snapshot if it ends in '.json',
+        otherwise the Prometheus text format.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            if path.lower().endswith(".json"):
+                json.dump(self.snapshot(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+
+METRICS = MetricsRegistry()
@@ -0,0 +1,184 @@
+"""
+Google Places Text Search and Place Details API client.
+
+`requests` is imported on the first call rather than at import time.
+"""
+import json
+import logging
+import time
+
+from .metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Text Search API
+BASE_URL_TEXT_SEARCH = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+
+# Place Details API
+BASE_URL_PLACE_DETAILS = "https://maps.googleapis.com/maps/api/place/details/json"
+
+DEFAULT_PLACE_DETAILS_FIELDS = "name,formatted_address,geometry,rating,user_ratings_total,website,formatted_phone_number,business_status,place_id,type"
+
+
+def record_places_request(api: str, result: dict, elapsed: float):
+    """
+    Records request count by API status and request latency for one Places API call.
+    """
+    if not METRICS.enabled:
+        return
+    METRICS.inc("places_requests_total", api=api, status=result.get("status", "UNKNOWN"))
+    METRICS.observe("places_request_seconds", elapsed, api=api)
+
+
+def _get_json(url: str, params: dict, api: str, api_name: str) -> dict:
+    import requests
+
+    start = time.perf_counter()
+    response = None
+    try:
+        response = requests.get(url, params=params)
+        response.raise_for_status()
+        result = response.json()
+    except requests.exceptions.HTTPError as err:
+        logger.warning("HTTP error occurred during %s: %s", api_name, err, extra={"api": api})
+        result = {"error": str(err), "status": "HTTP_ERROR"}
+    except requests.exceptions.ConnectionError as err:
+        logger.warning("Connection error occurred during %s: %s", api_name, err, extra={"api": api})
+        result = {"error": str(err), "status": "CONNECTION_ERROR"}
+    except requests.exceptions.Timeout as err:
+        logger.warning("Timeout error occurred during %s: %s", api_name, err, extra={"api": api})
+        result = {"error": str(err), "status": "TIMEOUT_ERROR"}
+    except requests.exceptions.RequestException as err:
+        logger.warning("An unexpected error occurred during %s: %s", api_name, err, extra={"api": api})
+        result = {"error": str(err), "status": "REQUEST_ERROR"}
+    except json.JSONDecodeError:
+        logger.warning("Could not decode JSON response from %s. Raw response: %s",
+                       api_name, response.text if response is not None else "", extra={"api": api})
+        result = {"error": "JSON_DECODE_ERROR", "status": "JSON_ERROR"}
+    record_places_request(api, result, time.perf_counter() - start)
+    return result
+
+
+def text_search_places(query: str, api_key: str, **kwargs) -> dict:
+    """
+    Performs a text search for places using the Google Places Text Search API.
+
+    Args:
+        query (str): The text string on which to search, e.g., 'restaurants in Sydney'.
+        api_key (str): Your Google Cloud API Key with Places API enabled.
+        **kwargs: Additional parameters for the API request (e.g., 'location', 'radius').
+                
+
+    Returns:
+        dict: The JSON response from the Text Search API. Returns an empty dict
+              or a dict with 'error' key if the request fails.
+    """
+    logger.debug("Calling Text Search API for query: %r", query)
+    params = {
+        'query': query,
+        'key': api_key,
+    }
+    params.update(kwargs) 
+
+    return _get_json(BASE_URL_TEXT_SEARCH, params, "text_search", "Text Search")
+
+
+def get_place_details(place_id: str, api_key: str, fields: str = None, **kwargs) -> dict:
+    """
+    Retrieves detailed information about a specific place using the Google Places Details API.
+
+    Args:
+        place_id (str): The unique identifier of the place for which to return details.
+        api_key (str): Your Google Cloud API Key with Places API enabled.
+        fields (str, optional): A comma-separated list of fields to return.
+                                If None, uses DEFAULT_PLACE_DETAILS_FIELDS.
+                                See Google Places Details API documentation for available fields.
+        **kwargs: Additional parameters for the API request (e.g., 'sessiontoken').
+                  
+
+    Returns:
+        dict: The JSON response from the Place Details API. Returns an empty dict
+              or a dict with 'error' key if the request fails.
+    """
+    logger.debug("Calling Place Details API for Place ID: %r", place_id)
+    params = {
+        'place_id': place_id,
+        'key': api_key,
+        'fields': fields if fields else DEFAULT_PLACE_DETAILS_FIELDS,
+    }
+    params.update(kwargs) 
+
+    return _get_json(BASE_URL_PLACE_DETAILS, params, "place_details", "Place Details")
+
+
+def place_details_to_record(details: dict) -> dict:
+    """
+    Flattens a Place Details 'result' into one row for a DataFrame/CSV, using 'N/A' for
+    missing fields.
+    """
+    record = {
+        'Name': details.get('name', 'N/A'),
+        'Place ID': details.get('place_id', 'N/A'),
+        'Address': details.get('formatted_address', 'N/A'),
+        'Phone': details.get('formatted_phone_number', 'N/A'),
+        'Website': details.get('website', 'N/A'),
+        'Rating': details.get('rating', 'N/A'),
+        'Total Ratings': details.get('user_ratings_total', 'N/A'),
+        'Business Status': details.get('business_status', 'N/A'),
+        'Types': ', '.join(details.get('types', [])),
+        'Latitude': 'N/A',
+        'Longitude': 'N/A'
+    }
+
+    if 'geometry' in details and 'location' in details['geometry']:
+        record['Latitude'] = details['geometry']['location'].get('lat', 'N/A')
+        record['Longitude'] = details['geometry']['location'].get('lng', 'N/A')
+    return record
+
+
+def search_place_records(query: str, api_key: str, max_results: int = 5, delay: float = 0.1) -> list:
+    """
+    Runs a text search and fetches Place Details for the top matches.
+
+    Args:
+        query (str): The text string on which to search, e.g., 'Coffee shops in Tryon, NC'.
+        api_key (str): Your Google Cloud API Key with Places API enabled.
+        max_results (int): Number of matches to fetch details for.
+        delay (float): Seconds to wait between Place Details calls, to be gentle on the API.
+
+    Returns:
+        list: One record (see place_details_to_record) per match whose details were found.
+    """
+    data_text_search = text_search_places(query, api_key)
+    status = data_text_search.get('status')
+
+    if status == 'ZERO_RESULTS':
+        logger.info("No results found for query: %r", query)
+        return []
+    if status != 'OK' or not data_text_search.get('results'):
+        logger.error("An error occurred during Text Search: %s",
+                     data_text_search.get('error_message', data_text_search.get('error', status)))
+        return []
+
+    results = data_text_search['results']
+    logger.info("Found %d potential matches for %r; fetching details for the top %d.",
+                len(results), query, min(len(results), max_results))
+
+    records = []
+    for i, basic_match in enumerate(results[:max_results]):
+        place_id = basic_match.get('place_id')
+        if not place_id:
+            logger.warning("Skipping result %d due to missing Place ID.", i + 1)
+            continue
+
+        data_place_details = get_place_details(place_id, api_key)
+        if data_place_details.get('status') == 'OK' and 'result' in data_place_details:
+            records.append(place_details_to_record(data_place_details['result']))
+        else:
+            logger.warning("No detailed results or error for Place ID %s: %s", place_id,
+                           data_place_details.get('error_message', data_place_details.get('error', 'No specific error message.')))
+
+        if delay and i + 1 < min(len(results), max_results):
+            time.sleep(delay)
+
+    return records
@@ -0,0 +1,290 @@
+"""
+Asyncio client for the Google Places API, for running many lookups concurrently.
+
+`aiohttp` is imported when a client is created rather than at import time.
+"""
+import asyncio
+import json
+import logging
+import time
+
+from .places import (
+    BASE_URL_TEXT_SEARCH,
+    BASE_URL_PLACE_DETAILS,
+    DEFAULT_PLACE_DETAILS_FIELDS,
+    place_details_to_record,
+    record_places_request,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_TIMEOUT_SECONDS = 30
+
+
+class _RateLimiter:
+    """
+    Spaces out request start times so that no more than `qps` requests begin per second.
+    """
+
+    def __init__(self, qps: float):
+        self._interval = 1.0 / qps
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AsyncPlacesClient:
+    """
+    Asyncio client for the Google Places Text Search and Place Details APIs.
+
+    All requests share one aiohttp connection pool. A semaphore caps the number of
+    requests on the wire and an optional QPS limiter spaces out request starts, so
+    thousands of lookups can be scheduled at once from a single process.
+
+    Return values match `places`: the decoded JSON response, or a dict with
+    'error' and 'status' keys if the request fails.
+
+    Usage:
+        async with AsyncPlacesClient(api_key, max_concurrency=50, qps=100) as client:
+            results = await client.text_search_many(queries)
+    """
+
+    def __init__(self, api_key: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 qps: float = None, timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 text_search_url: str = BASE_URL_TEXT_SEARCH,
+                 place_details_url: str = BASE_URL_PLACE_DETAILS):
+        """
+        Args:
+            api_key (str): Your Google Cloud API Key with Places API enabled.
+            max_concurrency (int): Maximum number of requests in flight at once. Also
+                                   used as the connection pool size.
+            qps (float, optional): Maximum number of requests started per second.
+                                   If None, requests are only limited by max_concurrency.
+            timeout (float): Total timeout in seconds for a single request.
+            text_search_url (str): Text Search endpoint, overridable for testing.
+            place_details_url (str): Place Details endpoint, overridable for testing.
+        """
+        self.api_key = api_key
+        self.max_concurrency = max_concurrency
+        self.text_search_url = text_search_url
+        self.place_details_url = place_details_url
+        import aiohttp
+
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = _RateLimiter(qps) if qps else None
+        self._session = None
+
+    async def __aenter__(self):
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_json(self, url: str, params: dict, api: str, api_name: str) -> dict:
+        if self._session is None:
+            raise RuntimeError("AsyncPlacesClient must be used as 'async with AsyncPlacesClient(...)'.")
+
+        async with self._semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+
+            start = time.perf_counter()
+            result = await self._fetch(url, params)
+            if "error" in result:
+                logger.warning("%s request failed (%s): %s", api_name, result["status"], result["error"],
+                               extra={"api": api})
+            record_places_request(api, result, time.perf_counter() - start)
+            return result
+
+    async def _fetch(self, url: str, params: dict) -> dict:
+        import aiohttp
+
+        # Like requests: drop None values and send booleans as 'True'/'False' (aiohttp
+        # raises TypeError for both).
+        params = {key: str(value) if isinstance(value, bool) else value
+                  for key, value in params.items() if value is not None}
+        try:
+            async with self._session.get(url, params=params) as response:
+                response.raise_for_status()
+                body = await response.read()
+            return json.loads(body)
+        except aiohttp.ClientResponseError as err:
+            return {"error": str(err), "status": "HTTP_ERROR"}
+        except asyncio.TimeoutError as err:
+            # Checked before ClientConnectionError: aiohttp's ServerTimeoutError subclasses both.
+            return {"error": str(err) or "Request timed out", "status": "TIMEOUT_ERROR"}
+        except aiohttp.ClientConnectionError as err:
+            return {"error": str(err), "status": "CONNECTION_ERROR"}
+        except aiohttp.ClientError as err:
+            return {"error": str(err), "status": "REQUEST_ERROR"}
+        except ValueError:
+            # json.JSONDecodeError, or UnicodeDecodeError for a body that isn't valid UTF-8.
+            return {"error": "JSON_DECODE_ERROR", "status": "JSON_ERROR"}
+
+    async def text_search_places(self, query: str, **kwargs) -> dict:
+        """
+        Performs a text search for places using the Google Places Text Search API.
+
+        Args:
+            query (str): The text string on which to search, e.g., 'restaurants in Sydney'.
+            **kwargs: Additional parameters for the API request (e.g., 'location', 'radius').
+
+        Returns:
+            dict: The JSON response from the Text Search API, or a dict with 'error' key
+                  if the request fails.
+        """
+        params = {
+            'query': query,
+            'key': self.api_key,
+        }
+        params.update(kwargs)
+        return await self._get_json(self.text_search_url, params, "text_search", "Text Search")
+
+    async def get_place_details(self, place_id: str, fields: str = None, **kwargs) -> dict:
+        """
+        Retrieves detailed information about a specific place using the Google Places Details API.
+
+        Args:
+            place_id (str): The unique identifier of the place for which to return details.
+            fields (str, optional): A comma-separated list of fields to return.
+                                    If None, uses DEFAULT_PLACE_DETAILS_FIELDS.
+            **kwargs: Additional parameters for the API request (e.g., 'sessiontoken').
+
+        Returns:
+            dict: The JSON response from the Place Details API, or a dict with 'error' key
+                  if the request fails.
+        """
+        params = {
+            'place_id': place_id,
+            'key': self.api_key,
+            'fields': fields if fields else DEFAULT_PLACE_DETAILS_FIELDS,
+        }
+        params.update(kwargs)
+        return await self._get_json(self.place_details_url, params, "place_details", "Place Details")
+
+    async def text_search_many(self, queries, **kwargs) -> list:
+        """
+        Runs a text search for every query concurrently. Results are returned in the same
+        order as `queries`.
+        """
+        return await asyncio.gather(*(self.text_search_places(q, **kwargs) for q in queries))
+
+    async def get_place_details_many(self, place_ids, fields: str = None, **kwargs) -> list:
+        """
+        Fetches details for every Place ID concurrently. Results are returned in the same
+        order as `place_ids`.
+        """
+        return await asyncio.gather(*(self.get_place_details(p, fields, **kwargs) for p in place_ids))
+
+
+def text_search_places_batch(queries, api_key: str, **client_kwargs) -> list:
+    """
+    Blocking helper that runs text searches for all `queries` on one event loop.
+
+    Args:
+        queries (list): Search strings, e.g., ['Coffee shops in Tryon, NC', ...].
+        api_key (str): Your Google Cloud API Key with Places API enabled.
+        **client_kwargs: Passed to AsyncPlacesClient (e.g., 'max_concurrency', 'qps').
+
+    Returns:
+        list: One response dict per query, in input order.
+    """
+    async def _run():
+        async with AsyncPlacesClient(api_key, **client_kwargs) as client:
+            return await client.text_search_many(queries)
+
+    return asyncio.run(_run())
+
+
+def get_place_details_batch(place_ids, api_key: str, fields: str = None, **client_kwargs) -> list:
+    """
+    Blocking helper that fetches Place Details for all `place_ids` on one event loop.
+
+    Args:
+        place_ids (list): Place IDs to look up.
+        api_key (str): Your Google Cloud API Key with Places API enabled.
+        fields (str, optional): A comma-separated list of fields to return.
+        **client_kwargs: Passed to AsyncPlacesClient (e.g., 'max_concurrency', 'qps').
+
+    Returns:
+        list: One response dict per Place ID, in input order.
+    """
+    async def _run():
+        async with AsyncPlacesClient(api_key, **client_kwargs) as client:
+            return await client.get_place_details_many(place_ids, fields)
+
+    return asyncio.run(_run())
+
+
+async def search_place_records_many(client: AsyncPlacesClient, queries, max_results: int = 1) -> list:
+    """
+    Runs a text search for every query, then fetches Place Details for the top `max_results`
+    matches of each, with all requests sharing `client`'s limits.
+
+    Returns:
+        list: One record per match (see places.place_details_to_record) with the originating
+              query in a leading 'Query' field, in query order.
+    """
+    searches = await client.text_search_many(queries)
+
+    matches = []
+    for query, data_text_search in zip(queries, searches):
+        status = data_text_search.get('status')
+        if status != 'OK':
+            if status != 'ZERO_RESULTS':
+                logger.warning("Text Search failed for %r: %s", query,
+                               data_text_search.get('error_message', data_text_search.get('error', status)))
+            continue
+        for basic_match in data_text_search.get('results', [])[:max_results]:
+            if basic_match.get('place_id'):
+                matches.append((query, basic_match['place_id']))
+
+    details = await client.get_place_details_many([place_id for _, place_id in matches])
+
+    records = []
+    for (query, place_id), data_place_details in zip(matches, details):
+        if data_place_details.get('status') == 'OK' and 'result' in data_place_details:
+            records.append({'Query': query, **place_details_to_record(data_place_details['result'])})
+        else:
+            logger.warning("No detailed results or error for Place ID %s: %s", place_id,
+                           data_place_details.get('error_message', data_place_details.get('error', 'No specific error message.')))
+    return records
+
+
+def search_place_records_batch(queries, api_key: str, max_results: int = 1, **client_kwargs) -> list:
+    """
+    Blocking helper around search_place_records_many.
+
+    Args:
+        queries (list): Search strings, e.g., ['Coffee shops in Tryon, NC', ...].
+        api_key (str): Your Google Cloud API Key with Places API enabled.
+        max_results (int): Number of matches per query to fetch details for.
+        **client_kwargs: Passed to AsyncPlacesClient (e.g., 'max_concurrency', 'qps').
+
+    Returns:
+        list: One record per match, in query order.
+    """
+    async def _run():
+        async with AsyncPlacesClient(api_key, **client_kwargs) as client:
+            return await search_place_records_many(client, queries, max_results)
+
+    return asyncio.run(_run())
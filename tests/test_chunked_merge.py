@@ -0,0 +1,125 @@
+"""
+The chunked merge/clean mode must write exactly what the in-memory mode writes, whatever
+the chunk size.
+"""
+import zipfile
+
+import pandas as pd
+import pytest
+
+from shining_rock_data import dsire_tables
+
+CHUNK_SIZES = [1, 3, 7]
+
+TABLE_SPECS = {
+    'default': dsire_tables.DSIRE_TABLE_SPECS,
+    # One output row per program per county: a one-to-many join.
+    'program_per_county': [dict(dsire_tables.DSIRE_TABLE_SPECS[0], dedupe=None)] + dsire_tables.DSIRE_TABLE_SPECS[1:],
+    # Keyed on a column brought in by an earlier table. Every program has a technology, so only
+    # counties without a program (a NaN Program Name) leave the int column unmatched.
+    'chained_key': dsire_tables.DSIRE_TABLE_SPECS + [{
+        'table': 'technology',
+        'columns': ['name', 'technology', 'sectors'],
+        'renames': {'technology': 'Technology', 'sectors': 'Sectors'},
+        'join_key': 'name',
+        'master_key': 'Program Name',
+        'key_type': 'str',
+        'output_columns': ['Technology', 'Sectors'],
+    }],
+}
+
+
+def _csv(rows, columns):
+    return pd.DataFrame(rows, columns=columns).to_csv(index=False)
+
+
+@pytest.fixture(params=sorted(TABLE_SPECS))
+def join_plan(request):
+    return dsire_tables.plan_dsire_joins(TABLE_SPECS[request.param])
+
+
+@pytest.fixture
+def dsire_inputs(tmp_path):
+    # Integer budgets plus a blank and a non-number: chunks without those used to come out as int64.
+    program = [
+        [i, state_id, f"Prog {i}", "A1", f"<p>Summary {i}</p>", "http://example.org", "Admin", "", budget]
+        for i, (state_id, budget) in enumerate([
+            (1, 100), (2, 250), (3, ""), (1, 75), (4, 100), ("", 10), (5, "TBD"), (2, 5), (6, 40),
+        ])
+    ]
+    state_info = [[state_id, f"<b>Intro {state_id}</b>", "History", "RPS", "Orgs", "p", "f"] for state_id in [1, 2, 3, 3, 4]]
+    contact = [
+        [state_id, f"First{i}", f"Last{i}", "Org", 5551234 if i % 2 else "", "a@example.org", "w", "1 Main St", "City", 28801]
+        for i, state_id in enumerate([1, 2, 4, 5, 6, 1, 2])
+    ]
+    technology = [[f"Prog {i}", f"Tech {i}", i % 3 + 1] for i in range(9)]
+
+    zip_path = tmp_path / "dsire.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("program.csv", _csv(program, [
+            "id", "state_id", "name", "code", "summary", "websiteurl", "administrator", "fundingsource", "budget"]))
+        zf.writestr("state_info_content.csv", _csv(state_info, [
+            "state_id", "introduction", "history", "renewable_portfolio_standard", "organizations", "programs", "footnotes"]))
+        zf.writestr("contact.csv", _csv(contact, [
+            "state_id", "first_name", "last_name", "organization_name", "phone", "email", "website_url", "address", "city", "zip"]))
+        zf.writestr("technology.csv", _csv(technology, ["name", "technology", "sectors"]))
+
+    lookup = [
+        [f" county {i} ", state_id, "north carolina", fips, appalachian]
+        for i, (state_id, fips, appalachian) in enumerate([
+            (1, 1001, True), (2, 37021, False), (3, 37021, True), (4, 1001, True), (7, 1001, False),
+            ("", 37021, True), (5, 1001, True), (1, 37021, False),
+        ])
+    ]
+    lookup_path = tmp_path / "lookup.csv"
+    pd.DataFrame(lookup, columns=["COUNTY", "State ID", "STATE", "FIPS", "Is_Appalachian"]).to_csv(lookup_path, index=False)
+    return str(zip_path), str(lookup_path)
+
+
+def _in_memory(zip_path, lookup_path, output_path, join_plan):
+    prepared_tables = dsire_tables.prepare_dsire_tables(zip_path, join_plan)
+    master_df = dsire_tables.load_appalachian_fips_lookup(lookup_path)
+    master_df.insert(0, "ID", range(1, 1 + len(master_df)))
+    master_df = dsire_tables.clean_master_df(dsire_tables.join_dsire_tables(master_df, prepared_tables), join_plan)
+    return dsire_tables.write_output_chunks([master_df], output_path, "Sheet")
+
+
+def _xlsx_cells(path):
+    from openpyxl import load_workbook
+
+    sheet = load_workbook(path).active
+    return [[(type(cell.value).__name__, cell.value) for cell in row] for row in sheet.iter_rows()]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_chunked_csv_matches_in_memory(dsire_inputs, join_plan, tmp_path, chunk_size):
+    zip_path, lookup_path = dsire_inputs
+
+    expected_rows = _in_memory(zip_path, lookup_path, str(tmp_path / "full.csv"), join_plan)
+    rows = dsire_tables.run_chunked_merge_and_clean(
+        zip_path, lookup_path, str(tmp_path / "chunked.csv"), "Sheet", chunk_size, join_plan)
+
+    assert rows == expected_rows
+    assert (tmp_path / "chunked.csv").read_text() == (tmp_path / "full.csv").read_text()
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_chunked_xlsx_matches_in_memory(dsire_inputs, join_plan, tmp_path, chunk_size):
+    pytest.importorskip("openpyxl")
+    zip_path, lookup_path = dsire_inputs
+
+    _in_memory(zip_path, lookup_path, str(tmp_path / "full.xlsx"), join_plan)
+    dsire_tables.run_chunked_merge_and_clean(
+        zip_path, lookup_path, str(tmp_path / "chunked.xlsx"), "Sheet", chunk_size, join_plan)
+
+    assert _xlsx_cells(tmp_path / "chunked.xlsx") == _xlsx_cells(tmp_path / "full.xlsx")
+
+
+def test_budget_is_float_in_every_chunk(dsire_inputs, join_plan, tmp_path):
+    zip_path, lookup_path = dsire_inputs
+
+    dsire_tables.run_chunked_merge_and_clean(
+        zip_path, lookup_path, str(tmp_path / "chunked.csv"), "Sheet", 1, join_plan)
+
+    budgets = pd.read_csv(tmp_path / "chunked.csv", dtype=str)["Budget"]
+    assert budgets.str.contains(r"\.").all()
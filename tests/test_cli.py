@@ -0,0 +1,67 @@
+"""
+CLI argument mapping and exit codes. Nothing here touches the network.
+"""
+import pytest
+
+from shining_rock_data import cli, dsire_etl
+from shining_rock_data.config import DSIRE_SETTINGS
+from shining_rock_data.metrics import METRICS
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    for env_var, _ in DSIRE_SETTINGS.values():
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.delenv("GOOGLE_PLACES_API_KEY", raising=False)
+
+
+@pytest.fixture
+def etl_calls(monkeypatch):
+    calls = []
+
+    def fake_run_dsire_etl(**settings):
+        calls.append(settings)
+        return 3
+    monkeypatch.setattr(dsire_etl, "run_dsire_etl", fake_run_dsire_etl)
+    return calls
+
+
+def test_etl_options_map_to_settings(etl_calls, monkeypatch):
+    monkeypatch.setenv("DSIRE_SHEET_NAME", "From env")
+
+    assert cli.main(["etl", "--output-file", "out.csv", "--chunk-size", "500", "--temp-dir", "downloads",
+                     "--metrics-file", "metrics.json"]) == 0
+
+    (settings,) = etl_calls
+    assert settings['output_file'] == "out.csv"
+    assert settings['chunk_size'] == 500
+    assert settings['temp_dir'] == "downloads"
+    assert settings['metrics_file'] == "metrics.json"
+    assert settings['sheet_name'] == "From env"
+    assert settings['prep_workers'] == DSIRE_SETTINGS['prep_workers'][1]
+
+
+def test_etl_bad_environment_value(etl_calls, monkeypatch, capsys):
+    monkeypatch.setenv("DSIRE_PREP_WORKERS", "many")
+
+    assert cli.main(["etl"]) == 2
+    assert "DSIRE_PREP_WORKERS='many'" in capsys.readouterr().err
+    assert etl_calls == []
+
+
+def test_places_without_api_key(capsys):
+    assert cli.main(["places", "search", "coffee"]) == 2
+    assert "GOOGLE_PLACES_API_KEY" in capsys.readouterr().err
+
+
+def test_places_failure_still_writes_metrics_and_restores_registry(tmp_path):
+    pytest.importorskip("aiohttp")
+    metrics_file = tmp_path / "metrics.json"
+    assert not METRICS.enabled
+
+    with pytest.raises(OSError):
+        cli.main(["places", "batch", str(tmp_path / "missing.txt"), "--api-key", "KEY",
+                  "--metrics-file", str(metrics_file)])
+
+    assert metrics_file.exists()
+    assert not METRICS.enabled
@@ -0,0 +1,42 @@
+"""
+resolve_settings: explicit argument, then environment variable, then default.
+"""
+import pytest
+
+from shining_rock_data.config import DSIRE_SETTINGS, resolve_settings
+
+
+def test_precedence(monkeypatch):
+    monkeypatch.setenv("DSIRE_SHEET_NAME", "From env")
+    monkeypatch.setenv("DSIRE_OUTPUT_FILE", "env.xlsx")
+    monkeypatch.delenv("DSIRE_FIPS_LOOKUP_FILE", raising=False)
+
+    settings = resolve_settings(DSIRE_SETTINGS, output_file="arg.xlsx", sheet_name=None)
+
+    assert settings['output_file'] == "arg.xlsx"
+    assert settings['sheet_name'] == "From env"
+    assert settings['fips_lookup_file'] == DSIRE_SETTINGS['fips_lookup_file'][1]
+
+
+def test_empty_environment_value_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("DSIRE_CHUNK_SIZE", "")
+    assert resolve_settings(DSIRE_SETTINGS)['chunk_size'] == 0
+
+
+def test_environment_values_take_the_default_type(monkeypatch):
+    monkeypatch.setenv("DSIRE_CHUNK_SIZE", "5000")
+    monkeypatch.setenv("DSIRE_PREP_WORKERS", "8")
+
+    settings = resolve_settings(DSIRE_SETTINGS)
+    assert (settings['chunk_size'], settings['prep_workers']) == (5000, 8)
+
+
+def test_bad_environment_value_names_the_variable(monkeypatch):
+    monkeypatch.setenv("DSIRE_CHUNK_SIZE", "abc")
+    with pytest.raises(ValueError, match="DSIRE_CHUNK_SIZE='abc'"):
+        resolve_settings(DSIRE_SETTINGS)
+
+
+def test_unknown_setting():
+    with pytest.raises(TypeError, match="chunksize"):
+        resolve_settings(DSIRE_SETTINGS, chunksize=10)
@@ -0,0 +1,83 @@
+"""
+MetricsRegistry: disabled no-op, reservoir quantiles and the JSON/Prometheus exports.
+"""
+import json
+
+from shining_rock_data.metrics import MetricsRegistry
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+    registry.inc("requests_total", api="text_search")
+    registry.set("rows", 5)
+    registry.observe("latency_seconds", 0.1)
+    with registry.timer("stage_seconds", stage="merge"):
+        pass
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == snapshot["gauges"] == snapshot["histograms"] == []
+
+
+def test_quantiles_are_exact_until_the_reservoir_fills():
+    registry = MetricsRegistry(enabled=True, reservoir_size=100)
+    for value in range(1, 101):
+        registry.observe("latency_seconds", value)
+
+    summary = registry.snapshot()["histograms"][0]["value"]
+    assert summary["count"] == 100
+    assert summary["sum"] == 5050
+    assert (summary["min"], summary["max"]) == (1, 100)
+    assert summary["quantiles"] == {"0.5": 50, "0.9": 90, "0.95": 95, "0.99": 99}
+
+
+def test_reservoir_stays_bounded_and_estimates_quantiles():
+    registry = MetricsRegistry(enabled=True, reservoir_size=500)
+    for value in range(100_000):
+        registry.observe("latency_seconds", value)
+
+    (histogram,) = registry._histograms.values()
+    assert len(histogram.samples) == 500
+
+    summary = registry.snapshot()["histograms"][0]["value"]
+    # count, sum, min and max stay exact; quantiles come from the uniform sample.
+    assert summary["count"] == 100_000
+    assert summary["sum"] == sum(range(100_000))
+    assert (summary["min"], summary["max"]) == (0, 99_999)
+    assert abs(summary["quantiles"]["0.5"] - 50_000) < 10_000
+    assert abs(summary["quantiles"]["0.9"] - 90_000) < 10_000
+
+
+def test_to_prometheus():
+    registry = MetricsRegistry(enabled=True)
+    registry.inc("requests_total", api="text_search", status="OK")
+    registry.inc("requests_total", 2, api="text_search", status="OK")
+    registry.set("rows", 7, table='say "hi"\\now')
+    registry.observe("latency_seconds", 0.5)
+
+    assert registry.to_prometheus() == "\n".join([
+        '# TYPE requests_total counter',
+        'requests_total{api="text_search",status="OK"} 3',
+        '# TYPE rows gauge',
+        'rows{table="say \\"hi\\"\\\\now"} 7',
+        '# TYPE latency_seconds summary',
+        'latency_seconds{quantile="0.5"} 0.5',
+        'latency_seconds{quantile="0.9"} 0.5',
+        'latency_seconds{quantile="0.95"} 0.5',
+        'latency_seconds{quantile="0.99"} 0.5',
+        'latency_seconds_sum 0.5',
+        'latency_seconds_count 1',
+    ]) + "\n"
+
+
+def test_write_picks_format_from_extension(tmp_path):
+    registry = MetricsRegistry(enabled=True)
+    registry.inc("requests_total", api="details")
+
+    json_path = tmp_path / "out" / "metrics.json"
+    registry.write(str(json_path))
+    snapshot = json.loads(json_path.read_text())
+    assert snapshot["counters"] == [{"name": "requests_total", "labels": {"api": "details"}, "value": 1}]
+
+    prom_path = tmp_path / "metrics.prom"
+    registry.write(str(prom_path))
+    assert prom_path.read_text() == registry.to_prometheus()
@@ -0,0 +1,129 @@
+"""
+AsyncPlacesClient against a local HTTP server: error dicts, result order and the QPS limit.
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from shining_rock_data.places_async import AsyncPlacesClient
+
+# path -> (HTTP status, body)
+_CANNED = {
+    "/not-json": (200, b"<html>Service Unavailable</html>"),
+    "/not-utf8": (200, b'{"status": "OK", "name": "\xff\xfe"}'),
+    "/server-error": (500, b'{"status": "UNKNOWN_ERROR"}'),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.server.requests.append((time.monotonic(), params))
+
+        if url.path in _CANNED:
+            status, body = _CANNED[url.path]
+        elif params.get("place_id") == "not-utf8":
+            status, body = _CANNED["/not-utf8"]
+        else:
+            time.sleep(random.uniform(0, 0.02))  # let responses finish out of order
+            status, body = 200, json.dumps({"status": "OK", "params": params}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/ok"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def _text_search(server, path, **kwargs):
+    async def _run():
+        async with AsyncPlacesClient("KEY", text_search_url=_url(server, path)) as client:
+            return await client.text_search_places("coffee", **kwargs)
+    return asyncio.run(_run())
+
+
+@pytest.mark.parametrize("path, status", [
+    ("/not-json", "JSON_ERROR"),
+    ("/not-utf8", "JSON_ERROR"),
+    ("/server-error", "HTTP_ERROR"),
+])
+def test_bad_responses_become_error_dicts(server, path, status):
+    result = _text_search(server, path)
+    assert result["status"] == status
+    assert "error" in result
+
+
+def test_connection_error_becomes_error_dict(server):
+    url = _url(server)
+    server.shutdown()
+    server.server_close()
+
+    async def _run():
+        async with AsyncPlacesClient("KEY", text_search_url=url) as client:
+            return await client.text_search_places("coffee")
+    assert asyncio.run(_run())["status"] == "CONNECTION_ERROR"
+
+
+def test_none_params_are_dropped(server):
+    result = _text_search(server, "/ok", location=None, radius=500, opennow=True)
+    assert result["params"] == {"query": "coffee", "key": "KEY", "radius": "500", "opennow": "True"}
+
+
+def test_one_bad_response_does_not_abort_the_batch(server):
+    async def _run():
+        async with AsyncPlacesClient("KEY", place_details_url=_url(server)) as client:
+            return await client.get_place_details_many(["a", "not-utf8", "b"])
+    good_a, bad, good_b = asyncio.run(_run())
+    assert (good_a["params"]["place_id"], good_b["params"]["place_id"]) == ("a", "b")
+    assert bad["status"] == "JSON_ERROR"
+
+
+def test_results_keep_query_order(server):
+    queries = [f"query {i}" for i in range(40)]
+
+    async def _run():
+        async with AsyncPlacesClient("KEY", max_concurrency=10, text_search_url=_url(server)) as client:
+            return await client.text_search_many(queries)
+    results = asyncio.run(_run())
+    assert [r["params"]["query"] for r in results] == queries
+
+
+def test_qps_limit_spaces_out_request_starts(server):
+    qps, count = 20, 10
+
+    async def _run():
+        async with AsyncPlacesClient("KEY", max_concurrency=count, qps=qps, text_search_url=_url(server)) as client:
+            return await client.text_search_many([str(i) for i in range(count)])
+    asyncio.run(_run())
+
+    starts = sorted(t for t, _ in server.requests)
+    assert len(starts) == count
+    # count requests at `qps` per second need at least (count - 1) intervals; allow for jitter.
+    assert starts[-1] - starts[0] >= 0.8 * (count - 1) / qps
@@ -0,0 +1,62 @@
+"""
+Join planning and table loading errors for the declarative DSIRE table specs.
+"""
+import zipfile
+
+import pandas as pd
+import pytest
+
+from shining_rock_data import dsire_tables
+
+
+def test_master_key_must_come_from_lookup_or_earlier_table():
+    tech = {'table': 'tech', 'columns': ['name', 'tech'], 'join_key': 'name', 'master_key': 'Program Name',
+            'key_type': 'str'}
+
+    assert dsire_tables.plan_dsire_joins(dsire_tables.DSIRE_TABLE_SPECS + [tech])[-1]['table'] == 'tech'
+    with pytest.raises(ValueError, match="master_key 'Program Name'"):
+        dsire_tables.plan_dsire_joins([tech] + dsire_tables.DSIRE_TABLE_SPECS)
+
+
+def test_master_key_uses_suffixed_name_after_clash():
+    specs = dsire_tables.DSIRE_TABLE_SPECS + [
+        {'table': 'extra', 'columns': ['state_id', 'budget'], 'renames': {'budget': 'Budget'}},
+        {'table': 'budgets', 'columns': ['amount'], 'join_key': 'amount', 'master_key': 'Budget_extra'},
+    ]
+    assert len(dsire_tables.plan_dsire_joins(specs)) == len(specs)
+
+    specs[-1] = dict(specs[-1], master_key='Budget')
+    with pytest.raises(ValueError, match="master_key 'Budget'"):
+        dsire_tables.plan_dsire_joins(specs)
+
+
+@pytest.fixture
+def program_zip(tmp_path):
+    zip_path = tmp_path / "dsire.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("program.csv", "state_id,name\n1,Prog 1\n")
+    return str(zip_path)
+
+
+def test_missing_spec_column_has_its_own_error(program_zip):
+    spec = {'table': 'program', 'columns': ['state_id', 'name', 'budget']}
+    join_plan = dsire_tables.plan_dsire_joins([spec])
+
+    with pytest.raises(ValueError, match="missing column"):
+        dsire_tables.prepare_dsire_tables(program_zip, join_plan)
+    assert dsire_tables.prepare_dsire_tables(
+        program_zip, dsire_tables.plan_dsire_joins([dict(spec, required=False)])) == []
+
+
+
+@pytest.mark.parametrize("dedupe", ['first', None])
+def test_master_key_is_coerced_to_key_type(dedupe):
+    master = pd.DataFrame({'ID': [1, 2, 3], 'State ID': [1, 2, 9]})
+    spec = dsire_tables.plan_dsire_joins(
+        [{'table': 'notes', 'columns': ['state_id', 'note'], 'key_type': 'str', 'dedupe': dedupe}])[0]
+    notes = pd.DataFrame({'state_id': ['1', '2', 'nan'], 'note': ['one', 'two', 'blank key']})
+
+    joined = dsire_tables.join_dsire_tables(master, [(spec, notes)])
+
+    assert joined['note'].tolist()[:2] == ['one', 'two']
+    assert pd.isna(joined['note'].iloc[2])